@@ -0,0 +1,30 @@
+"""add scenes owner_id id index
+
+Revision ID: 3f1c2a7d9b10
+Revises:
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7d9b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are created on startup, so the index may already exist
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scenes_owner_id_id_desc "
+        "ON scenes (owner_id, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_scenes_owner_id_id_desc")
@@ -0,0 +1,37 @@
+"""store scene data as jsonb
+
+Revision ID: 8a4e6b2c1d07
+Revises: 3f1c2a7d9b10
+Create Date: 2026-10-15 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4e6b2c1d07'
+down_revision: Union[str, None] = '3f1c2a7d9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE scenes ALTER COLUMN scene_data TYPE JSONB "
+        "USING scene_data::jsonb"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scenes_data_gin "
+        "ON scenes USING GIN (scene_data jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_scenes_data_gin")
+    op.execute(
+        "ALTER TABLE scenes ALTER COLUMN scene_data TYPE JSON "
+        "USING scene_data::json"
+    )
@@ -1,10 +1,12 @@
+import sys
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.database import get_db
+from ...core.database import get_async_db
 from ...core.security import get_current_user
 from ...models.user import User
-from ...schemas.action import PromptRequest, ActionResponse
+from ...schemas.action import PromptRequest, ActionResponse, ActionType
 from ...services.prompt_parser import PromptParser
 
 router = APIRouter(prefix="/prompt", tags=["prompts"])
@@ -12,44 +14,40 @@ router = APIRouter(prefix="/prompt", tags=["prompts"])
 # Initialize the prompt parser
 prompt_parser = PromptParser()
 
+# Plain string value of each action type, for building response messages
+_ACTION_VALUE = {action: sys.intern(action.value) for action in ActionType}
 
-@router.post("", response_model=ActionResponse)
-async def parse_prompt(
-    request: PromptRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Parse a natural language prompt and return structured scene actions.
+# Response for prompts that yield no actions; copied per request with the prompt filled in
+_UNRECOGNIZED_RESPONSE = ActionResponse(
+    success=False,
+    actions=[],
+    message=(
+        "Could not understand the prompt. Try commands like 'add robot arm', "
+        "'rotate conveyor 45 degrees', or 'zoom to inspection area'."
+    ),
+    original_prompt=""
+)
 
-    Examples:
-    - "Add a robotic arm next to the conveyor"
-    - "Rotate the arm 30 degrees"
-    - "Highlight safety zone in red"
-    - "Zoom camera to inspection area"
-    """
+
+async def _do_parse(request: PromptRequest) -> ActionResponse:
+    """Parse a prompt and build the response shared by both prompt endpoints."""
     try:
-        actions = prompt_parser.parse(request.prompt, request.context)
+        # Parsing is CPU-bound; keep it off the event loop
+        actions = await run_in_threadpool(prompt_parser.parse, request.prompt, request.context)
 
         if not actions:
-            return ActionResponse(
-                success=False,
-                actions=[],
-                message="Could not understand the prompt. Try commands like 'add robot arm', 'rotate conveyor 45 degrees', or 'zoom to inspection area'.",
-                original_prompt=request.prompt
-            )
-
-        action_descriptions = []
-        for action in actions:
-            desc = f"{action.action.value}"
-            if action.target:
-                desc += f" on {action.target}"
-            action_descriptions.append(desc)
+            return _UNRECOGNIZED_RESPONSE.model_copy(update={"original_prompt": request.prompt})
+
+        action_descriptions = ", ".join([
+            f"{_ACTION_VALUE[action.action]} on {action.target}" if action.target
+            else _ACTION_VALUE[action.action]
+            for action in actions
+        ])
 
         return ActionResponse(
             success=True,
             actions=actions,
-            message=f"Parsed {len(actions)} action(s): {', '.join(action_descriptions)}",
+            message=f"Parsed {len(actions)} action(s): {action_descriptions}",
             original_prompt=request.prompt
         )
 
@@ -60,39 +58,28 @@ async def parse_prompt(
         )
 
 
+@router.post("", response_model=ActionResponse)
+async def parse_prompt(
+    request: PromptRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Parse a natural language prompt and return structured scene actions.
+
+    Examples:
+    - "Add a robotic arm next to the conveyor"
+    - "Rotate the arm 30 degrees"
+    - "Highlight safety zone in red"
+    - "Zoom camera to inspection area"
+    """
+    return await _do_parse(request)
+
+
 @router.post("/demo", response_model=ActionResponse)
 async def parse_prompt_demo(request: PromptRequest):
     """
     Demo endpoint for parsing prompts without authentication.
     Useful for testing and development.
     """
-    try:
-        actions = prompt_parser.parse(request.prompt, request.context)
-
-        if not actions:
-            return ActionResponse(
-                success=False,
-                actions=[],
-                message="Could not understand the prompt. Try commands like 'add robot arm', 'rotate conveyor 45 degrees', or 'zoom to inspection area'.",
-                original_prompt=request.prompt
-            )
-
-        action_descriptions = []
-        for action in actions:
-            desc = f"{action.action.value}"
-            if action.target:
-                desc += f" on {action.target}"
-            action_descriptions.append(desc)
-
-        return ActionResponse(
-            success=True,
-            actions=actions,
-            message=f"Parsed {len(actions)} action(s): {', '.join(action_descriptions)}",
-            original_prompt=request.prompt
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error parsing prompt: {str(e)}"
-        )
+    return await _do_parse(request)
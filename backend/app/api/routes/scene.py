@@ -1,52 +1,113 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.database import get_db
+from ...core.database import get_async_db
 from ...core.security import get_current_user
+from ...models.scene import Scene
 from ...models.user import User
 from ...schemas.scene import SceneCreate, SceneResponse, SceneUpdate, SceneListResponse
 from ...services.scene_service import SceneService
+from ...services.scene_cache import scene_cache
 
 router = APIRouter(prefix="/scene", tags=["scenes"])
 
+# Scenes with at least this many objects are streamed rather than encoded and cached whole
+STREAM_MIN_OBJECTS = 500
+
+
+def _scene_data_chunks(scene_data: Dict[str, Any]) -> Iterator[bytes]:
+    """Encode scene data as JSON, yielding one chunk per scene object."""
+    for i, (key, value) in enumerate(scene_data.items()):
+        prefix = (b"," if i else b"") + orjson.dumps(key) + b":"
+        if key == "objects" and isinstance(value, list):
+            yield prefix + b"["
+            for j, obj in enumerate(value):
+                yield (b"," if j else b"") + orjson.dumps(obj)
+            yield b"]"
+        else:
+            yield prefix + orjson.dumps(value)
+
+
+def scene_to_chunks(scene: Scene) -> Iterator[bytes]:
+    """Encode a scene as a SceneResponse JSON document in chunks.
+
+    Fields follow SceneResponse's order, so the output is byte-for-byte the
+    same as the cached, whole-document encoding.
+    """
+    head = orjson.dumps({
+        "id": scene.id,
+        "name": scene.name,
+        "description": scene.description,
+    })
+    tail = orjson.dumps({
+        "owner_id": scene.owner_id,
+        "created_at": scene.created_at,
+        "updated_at": scene.updated_at,
+    })
+    yield head[:-1] + b',"scene_data":{'
+    yield from _scene_data_chunks(scene.scene_data)
+    yield b"}," + tail[1:]
+
 
 @router.post("/save", response_model=SceneResponse, status_code=status.HTTP_201_CREATED)
 async def save_scene(
     scene_data: SceneCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Save a new scene."""
-    scene = SceneService.create_scene(db, scene_data, current_user.id)
+    scene = await SceneService.create_scene(db, scene_data, current_user.id)
     return scene
 
 
 @router.get("/load/{scene_id}", response_model=SceneResponse)
 async def load_scene(
     scene_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Load a scene by ID."""
-    scene = SceneService.get_scene(db, scene_id, current_user.id)
-    if not scene:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scene not found"
-        )
-    return scene
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Scene not found"
+    )
+
+    version = await SceneService.get_scene_version(db, scene_id, current_user.id)
+    if version is None:
+        raise not_found
+
+    # Serve the already-encoded response when the scene hasn't changed
+    body = scene_cache.get(scene_id, version)
+    if body is None:
+        scene = await SceneService.get_scene(db, scene_id, current_user.id)
+        if not scene:
+            raise not_found
+        # Large scenes are streamed object by object instead of held encoded in memory
+        if len(scene.scene_data.get("objects", ())) >= STREAM_MIN_OBJECTS:
+            return StreamingResponse(scene_to_chunks(scene), media_type="application/json")
+        body = scene_cache.put(scene)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/list", response_model=List[SceneListResponse])
 async def list_scenes(
-    skip: int = 0,
+    response: Response,
+    cursor: Optional[int] = None,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all scenes for the current user."""
-    scenes = SceneService.get_scenes(db, current_user.id, skip, limit)
+    """
+    List scenes for the current user, newest first.
+    Pass the X-Next-Cursor header value as `cursor` to fetch the next page.
+    """
+    scenes = await SceneService.get_scenes(db, current_user.id, cursor, limit)
+    if scenes and len(scenes) == limit:
+        response.headers["X-Next-Cursor"] = str(scenes[-1].id)
     return scenes
 
 
@@ -54,11 +115,11 @@ async def list_scenes(
 async def update_scene(
     scene_id: int,
     scene_data: SceneUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing scene."""
-    scene = SceneService.update_scene(db, scene_id, current_user.id, scene_data)
+    scene = await SceneService.update_scene(db, scene_id, current_user.id, scene_data)
     if not scene:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,11 +131,11 @@ async def update_scene(
 @router.delete("/delete/{scene_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_scene(
     scene_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete a scene."""
-    success = SceneService.delete_scene(db, scene_id, current_user.id)
+    success = await SceneService.delete_scene(db, scene_id, current_user.id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,3 +1,3 @@
-from .config import settings
+from .config import settings, get_settings
 from .security import create_access_token, verify_password, get_password_hash
-from .database import get_db, engine, Base
+from .database import get_async_db, engine, async_engine, Base
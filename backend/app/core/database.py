@@ -1,8 +1,11 @@
+import orjson
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from .config import settings
 
+# Sync engine, only used to create tables at startup
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
@@ -10,15 +13,33 @@ engine = create_engine(
     max_overflow=20
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _json_dumps(value) -> str:
+    """Encode JSON column values with orjson instead of the stdlib encoder."""
+    return orjson.dumps(value).decode()
+
+
+# Async engine on the same database through asyncpg, so queries don't block the event loop
+async_engine = create_async_engine(
+    make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency for getting database sessions."""
-    db = SessionLocal()
-    try:
+async def get_async_db():
+    """Dependency for getting async database sessions."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,5 +1,15 @@
+"""
+FastAPI application entry point.
+
+In production the app runs under Gunicorn with Uvicorn workers (see gunicorn.conf.py),
+which use uvloop for the event loop and httptools for HTTP parsing:
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .core.config import settings
 from .core.database import engine, Base
@@ -15,9 +25,13 @@ app = FastAPI(
     description="A prompt-driven 3D industrial simulation studio API",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
-    redoc_url=f"{settings.API_V1_PREFIX}/redoc"
+    redoc_url=f"{settings.API_V1_PREFIX}/redoc",
+    default_response_class=ORJSONResponse
 )
 
+# Compress larger responses such as saved scenes
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +39,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -10,10 +11,22 @@ class Scene(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    scene_data = Column(JSON, nullable=False)  # Stores the complete scene state
+    scene_data = Column(JSONB, nullable=False)  # Stores the complete scene state
     thumbnail_url = Column(String(500), nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     owner = relationship("User", back_populates="scenes")
+
+    __table_args__ = (
+        # Serves the per-owner, newest-first keyset pagination in /scene/list
+        Index("ix_scenes_owner_id_id_desc", owner_id, id.desc()),
+        # Supports containment queries over scene contents, e.g. by object type
+        Index(
+            "ix_scenes_data_gin",
+            scene_data,
+            postgresql_using="gin",
+            postgresql_ops={"scene_data": "jsonb_path_ops"},
+        ),
+    )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List
 from enum import Enum
 
 
@@ -1,3 +1,4 @@
 from .prompt_parser import PromptParser
 from .scene_service import SceneService
+from .scene_cache import SceneCache, scene_cache
 from .auth_service import AuthService
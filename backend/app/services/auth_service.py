@@ -1,5 +1,7 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.user import User
 from ..schemas.user import UserCreate
 from ..core.security import get_password_hash, verify_password
@@ -9,35 +11,38 @@ class AuthService:
     """Service for user authentication."""
 
     @staticmethod
-    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Get a user by email."""
-        return db.query(User).filter(User.email == email).first()
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
 
     @staticmethod
-    def get_user_by_username(db: Session, username: str) -> Optional[User]:
+    async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
         """Get a user by username."""
-        return db.query(User).filter(User.username == username).first()
+        result = await db.execute(select(User).where(User.username == username))
+        return result.scalars().first()
 
     @staticmethod
-    def create_user(db: Session, user_data: UserCreate) -> User:
+    async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
         """Create a new user."""
-        hashed_password = get_password_hash(user_data.password)
+        # bcrypt is deliberately slow; keep it off the event loop
+        hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
         db_user = User(
             email=user_data.email,
             username=user_data.username,
             hashed_password=hashed_password
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
 
     @staticmethod
-    def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
         """Authenticate a user."""
-        user = AuthService.get_user_by_username(db, username)
+        user = await AuthService.get_user_by_username(db, username)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await run_in_threadpool(verify_password, password, user.hashed_password):
             return None
         return user
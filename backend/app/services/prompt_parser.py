@@ -1,8 +1,125 @@
 import re
-import uuid
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from typing import List, Dict, Any, Hashable, NamedTuple, Optional, Tuple
+from cachetools import LRUCache
 from ..schemas.action import SceneAction, ActionType, ObjectType
 
+# Intent trigger patterns, compiled once at import instead of per call
+_ADD_RE = re.compile(r'\b(add|create|place|put|insert|spawn|generate)\b')
+_REMOVE_RE = re.compile(r'\b(remove|delete|destroy|clear|erase)\b')
+_ROTATE_RE = re.compile(r'\b(rotate|turn|spin|twist|orient)\b')
+_MOVE_RE = re.compile(r'\b(move|shift|translate|position|relocate)\b')
+_SCALE_RE = re.compile(r'\b(scale|resize|grow|shrink|enlarge|expand|reduce)\b')
+_HIGHLIGHT_RE = re.compile(r'\b(highlight|glow|mark|emphasize|select)\b')
+_CAMERA_RE = re.compile(r'\b(zoom|camera|view|look|focus|pan)\b')
+_HIDE_RE = re.compile(r'\b(hide|invisible)\b')
+_SHOW_RE = re.compile(r'\b(show|visible|reveal)\b')
+_RESET_RE = re.compile(r'\b(reset|clear|restart)\b(?:\s+the)?\s*\b(scene|all|everything)\b')
+_ANIMATE_START_RE = re.compile(r'\b(animate|start|run|activate)\b')
+_ANIMATE_STOP_RE = re.compile(r'\b(stop|pause|deactivate)\b')
+
+# Value extraction patterns
+_NUMBER_RE = re.compile(r'[-+]?\d*\.?\d+')
+_COORD_RE = re.compile(r'\(?\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\)?')
+# Keyword groups checked within a command; a leading \b keeps e.g. "reset" from counting as "set"
+_AXIS_Y_RE = re.compile(r'\b(horizontal|side to side|yaw)')
+_AXIS_X_RE = re.compile(r'\b(vertical|up and down|pitch)')
+_AXIS_Z_RE = re.compile(r'\b(roll|twist)')
+_AXIS_NAME_RE = re.compile(r'\b([xyz])(?:[- ]axis)?\b')
+_REMOVE_ALL_RE = re.compile(r'\b(all|everything|scene)\b')
+_SHRINK_RE = re.compile(r'\b(shrink|reduce|smaller)\b')
+_GROW_RE = re.compile(r'\b(grow|enlarge)\b')
+# "re" is allowed before color/paint so "recolor" and "repaint" still count
+_COLOR_VERB_RE = re.compile(r'\b(?:re)?(?:color|paint)|\b(?:make|set|change)')
+_DIRECTION_RE = re.compile(r'\b(left|right|up|down|forward|front|backward|back)(?:wards?|s)?\b')
+
+# Move directions as (word, axis, sign); an earlier entry wins over a later one on the same axis
+_DIRECTIONS = (
+    ("left", "x", -1),
+    ("right", "x", 1),
+    ("up", "y", 1),
+    ("down", "y", -1),
+    ("forward", "z", 1),
+    ("front", "z", 1),
+    ("back", "z", -1),
+    ("backward", "z", -1),
+)
+
+# A number with an angle unit; failing that, the first number after a rotate verb
+_DEGREES_RE = re.compile(r'(\d+)(?:\s*deg|°)')
+_ROTATE_AMOUNT_RE = re.compile(r'(?:rotate|turn).*?(\d+)')
+
+
+class _Vec3(NamedTuple):
+    """An x/y/z triple; converted to a dict only when placed in action params."""
+    x: float
+    y: float
+    z: float
+
+
+_ORIGIN = _Vec3(0, 0, 0)
+
+
+class _ContextObject(NamedTuple):
+    """A scene context object with its name and type normalized for matching."""
+    id: str
+    name: str
+    type_name: str
+    data: Dict[str, Any]
+
+
+# A normalized scene context, as passed between the parser's helpers
+_Objects = Tuple[_ContextObject, ...]
+
+
+def _index_context(context: Optional[Dict[str, Any]]) -> _Objects:
+    """Normalize the context's objects once so each parse doesn't redo it per lookup."""
+    if not context or "objects" not in context:
+        return ()
+    return tuple(
+        _ContextObject(
+            obj.get("id", ""),
+            obj.get("name", "").lower(),
+            obj.get("type", "").lower().replace("_", " "),
+            obj
+        )
+        for obj in context["objects"]
+    )
+
+
+# Larger scenes are parsed without memoizing: their keys hold every object and
+# rarely repeat, since each added object changes the context
+_MEMO_MAX_OBJECTS = 16
+
+
+def _context_key(objects: _Objects) -> Optional[Hashable]:
+    """Build a cache key from the context fields parsing depends on.
+
+    Returns None, meaning don't memoize, if the context is unhashable or too large.
+    """
+    if len(objects) > _MEMO_MAX_OBJECTS:
+        return None
+    key = tuple(
+        (
+            obj.id,
+            obj.name,
+            obj.data.get("type"),
+            obj.data.get("color"),
+            tuple(position.items()) if isinstance(position, dict) else position
+        )
+        for obj in objects
+        for position in (obj.data.get("position"),)
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Actions that allocate a new object ID; results containing them can't be replayed
+_ALLOCATING_ACTIONS = frozenset([ActionType.ADD_OBJECT, ActionType.ADD_SAFETY_ZONE])
+
 
 class PromptParser:
     """
@@ -33,6 +150,12 @@ class PromptParser:
         "ball": ObjectType.SPHERE,
     }
 
+    # All object phrases as one pattern, longest first, so a single search finds
+    # the earliest phrase and prefers "robot arm" over "robot" at the same spot
+    _OBJECT_RE = re.compile('|'.join(
+        re.escape(phrase) for phrase in sorted(OBJECT_MAPPINGS, key=len, reverse=True)
+    ))
+
     # Color mappings
     COLOR_MAPPINGS = {
         "red": "#ff4444",
@@ -52,6 +175,9 @@ class PromptParser:
         "brown": "#8b4513",
     }
 
+    # Color names as whole words, or a hex code, found in one pass
+    _COLOR_RE = re.compile(r'\b(' + '|'.join(COLOR_MAPPINGS) + r')\b|(#[0-9a-fA-F]{6})')
+
     # Position keywords (ordered by specificity/preference)
     POSITION_KEYWORDS = [
         ("next to", {"x": 3, "y": 0, "z": 0}),
@@ -74,6 +200,19 @@ class PromptParser:
         ("middle", {"x": 0, "y": 0, "z": 0}),
     ]
 
+    # All position keywords as one pattern. Longer keywords come first so that
+    # "on the left" wins over "on" when both start at the same place.
+    _POSITION_RE = re.compile(r'\b(' + '|'.join(
+        re.escape(keyword) for keyword, _ in sorted(POSITION_KEYWORDS, key=lambda kw: -len(kw[0]))
+    ) + r')\b')
+    _POSITION_OFFSETS = {keyword: _Vec3(**offset) for keyword, offset in POSITION_KEYWORDS}
+
+    # Keywords that put a new object on the ground beside its reference object
+    _GROUND_KEYWORDS = frozenset([
+        "near", "beside", "next to", "left", "right", "front", "back",
+        "on the left", "on the right", "on the front", "on the back", "around",
+    ])
+
     # Camera positions for common areas
     CAMERA_TARGETS = {
         "inspection area": {"position": {"x": 5, "y": 5, "z": 5}, "target": {"x": 0, "y": 1, "z": 0}},
@@ -86,406 +225,406 @@ class PromptParser:
 
     def __init__(self):
         self.object_counter = {}
+        # parse() may run concurrently on worker threads
+        self._id_lock = threading.Lock()
+        # Recent results by (prompt, context); guarded by its own lock for the same reason
+        self._results = LRUCache(maxsize=512)
+        self._results_lock = threading.Lock()
+        # Exact short add prompts ("add a box", "place an arm") mapped straight to their object type
+        self._add_fast = {
+            f"{verb} {article} {phrase}": obj_type
+            for verb in ("add", "create", "place", "put")
+            for article in ("a", "an")
+            for phrase, obj_type in self.OBJECT_MAPPINGS.items()
+        }
+
+    def reset_ids(self) -> None:
+        """Restart object ID numbering, as if no objects had been added yet."""
+        with self._id_lock:
+            self.object_counter.clear()
 
     def parse(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> List[SceneAction]:
         """
         Parse a natural language prompt and return a list of scene actions.
         """
+        # Built per call rather than kept on self, as parse() may run on several threads
+        objects = _index_context(context)
+        return self._parse_indexed(prompt, objects, _context_key(objects))
+
+    def parse_many(
+        self,
+        prompts: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[List[SceneAction]]:
+        """
+        Parse several prompts against the same scene context, normalizing the context once.
+        Actions from one prompt are not applied to the context seen by the next.
+        """
+        objects = _index_context(context)
+        ctx_key = _context_key(objects)
+        return [self._parse_indexed(prompt, objects, ctx_key) for prompt in prompts]
+
+    def _parse_indexed(
+        self,
+        prompt: str,
+        objects: _Objects,
+        ctx_key: Optional[Hashable]
+    ) -> List[SceneAction]:
+        """Parse one prompt against an already normalized context."""
         prompt_lower = prompt.lower().strip()
-        actions = []
-
-        # Try each parser in order of specificity
-        parsers = [
-            self._parse_add_command,
-            self._parse_remove_command,
-            self._parse_rotate_command,
-            self._parse_move_command,
-            self._parse_scale_command,
-            self._parse_color_command,
-            self._parse_highlight_command,
-            self._parse_camera_command,
-            self._parse_visibility_command,
-            self._parse_reset_command,
-            self._parse_animate_command,
-        ]
-
-        for parser in parsers:
-            result = parser(prompt_lower, context)
-            if result:
-                actions.extend(result)
-
-        # If no actions were parsed, try to infer intent
-        if not actions:
-            actions = self._infer_intent(prompt_lower, context)
 
-        return actions
-
-    def _generate_object_id(self, object_type: str, context: Optional[Dict] = None) -> str:
-        """Generate a unique ID for a new object, ensuring it doesn't exist in context."""
-        if object_type not in self.object_counter:
-            self.object_counter[object_type] = 0
+        # Common short add prompts skip the parser cascade;
+        # only position and color still need the text
+        obj_type = self._add_fast.get(prompt_lower.rstrip(".!"))
+        if obj_type:
+            return [self._add_object_action(obj_type, prompt_lower, objects)]
+
+        key = (prompt_lower, ctx_key) if ctx_key is not None else None
+        if key is not None:
+            with self._results_lock:
+                cached = self._results.get(key)
+            if cached is not None:
+                # Copies, so callers can't modify what later calls get back
+                return [action.model_copy(deep=True) for action in cached]
+
+        # Try each parser in order of specificity; the first that understands the prompt wins
+        for parser in self._PARSERS:
+            actions = parser(self, prompt_lower, objects)
+            if actions:
+                break
+        else:
+            # If no actions were parsed, try to infer intent
+            actions = self._infer_intent(prompt_lower, objects)
+
+        if key is not None and not any(action.action in _ALLOCATING_ACTIONS for action in actions):
+            with self._results_lock:
+                self._results[key] = tuple(actions)
+            return [action.model_copy(deep=True) for action in actions]
 
-        existing_ids = set()
-        if context and "objects" in context:
-            existing_ids = {obj.get("id") for obj in context["objects"]}
+        return actions
 
-        while True:
-            self.object_counter[object_type] += 1
-            new_id = f"{object_type}_{self.object_counter[object_type]}"
-            if new_id not in existing_ids:
-                return new_id
+    def _generate_object_id(self, object_type: str, objects: _Objects = ()) -> str:
+        """Generate a unique ID for a new object, numbered past any existing one of its type."""
+        # Highest numeric suffix among context IDs like "box_3"; numbering above it can't collide
+        prefix = f"{object_type}_"
+        highest = 0
+        for obj in objects:
+            if isinstance(obj.id, str) and obj.id.startswith(prefix):
+                suffix = obj.id[len(prefix):]
+                if suffix.isdecimal():
+                    highest = max(highest, int(suffix))
+
+        with self._id_lock:
+            count = max(self.object_counter.get(object_type, 0), highest) + 1
+            self.object_counter[object_type] = count
+        return f"{object_type}_{count}"
 
     def _extract_object_type(self, text: str) -> Optional[Tuple[ObjectType, str]]:
         """Extract object type from text, returns (type, matched_text)."""
-        matches = []
-        for phrase, obj_type in self.OBJECT_MAPPINGS.items():
-            index = text.find(phrase)
-            if index != -1:
-                matches.append((index, len(phrase), obj_type, phrase))
-
-        if not matches:
+        match = self._OBJECT_RE.search(text)
+        if not match:
             return None, None
 
-        # Sort by index (earliest first), then by length (longest first)
-        matches.sort(key=lambda x: (x[0], -x[1]))
-        return matches[0][2], matches[0][3]
+        phrase = match.group()
+        return self.OBJECT_MAPPINGS[phrase], phrase
 
     def _extract_color(self, text: str) -> Optional[str]:
         """Extract color from text."""
-        for color_name, hex_code in self.COLOR_MAPPINGS.items():
-            if color_name in text:
-                return hex_code
-        # Check for hex color
-        hex_match = re.search(r'#[0-9a-fA-F]{6}', text)
-        if hex_match:
-            return hex_match.group()
-        return None
+        names = set()
+        hex_code = None
+        for match in self._COLOR_RE.finditer(text):
+            name, code = match.groups()
+            if name:
+                names.add(name)
+            elif hex_code is None:
+                hex_code = code
+        # A named color wins over a hex code, in COLOR_MAPPINGS order as before
+        if names:
+            for color_name, value in self.COLOR_MAPPINGS.items():
+                if color_name in names:
+                    return value
+        return hex_code
 
     def _extract_number(self, text: str, default: float = 0) -> float:
         """Extract a number from text."""
-        match = re.search(r'[-+]?\d*\.?\d+', text)
+        match = _NUMBER_RE.search(text)
         if match:
             return float(match.group())
         return default
 
     def _extract_degrees(self, text: str) -> Optional[float]:
         """Extract degrees from text."""
-        patterns = [
-            r'(\d+)\s*degrees?',
-            r'(\d+)\s*deg',
-            r'(\d+)°',
-            r'rotate.*?(\d+)',
-            r'turn.*?(\d+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return float(match.group(1))
+        match = _DEGREES_RE.search(text) or _ROTATE_AMOUNT_RE.search(text)
+        if match:
+            return float(match.group(1))
         return None
 
     def _extract_axis(self, text: str) -> str:
         """Extract axis from text."""
-        if any(word in text for word in ['horizontal', 'side to side', 'yaw']):
+        if _AXIS_Y_RE.search(text):
             return 'y'
-        if any(word in text for word in ['vertical', 'up and down', 'pitch']):
+        if _AXIS_X_RE.search(text):
             return 'x'
-        if any(word in text for word in ['roll', 'twist']):
-            return 'z'
-        # Check explicit axis mentions
-        if ' x ' in text or text.endswith(' x') or 'x-axis' in text or 'x axis' in text:
-            return 'x'
-        if ' y ' in text or text.endswith(' y') or 'y-axis' in text or 'y axis' in text:
-            return 'y'
-        if ' z ' in text or text.endswith(' z') or 'z-axis' in text or 'z axis' in text:
+        if _AXIS_Z_RE.search(text):
             return 'z'
+        # Check explicit axis mentions, preferring x, then y, then z
+        named = set(_AXIS_NAME_RE.findall(text))
+        for axis in ('x', 'y', 'z'):
+            if axis in named:
+                return axis
         return 'y'  # Default to Y axis
 
-    def _extract_position(self, text: str, context: Optional[Dict] = None) -> Dict[str, float]:
+    def _extract_position(self, text: str, objects: _Objects = ()) -> _Vec3:
         """Extract position from text relative to existing objects or absolute."""
-        position = {"x": 0, "y": 0, "z": 0}
-
-        # Find all matching keywords and their positions
-        matches = []
-        for keyword, offset in self.POSITION_KEYWORDS:
-            # Check for keyword with word boundaries
-            pattern = rf'\b{re.escape(keyword)}\b'
-            match = re.search(pattern, text)
-            if match:
-                matches.append((match.start(), keyword, offset))
-
-        # Use the earliest match if any
-        if matches:
-            matches.sort(key=lambda x: x[0])
-            position = matches[0][2].copy()
+        position = _ORIGIN
+
+        # Use the earliest position keyword if any; also reused for the relative offset below
+        keyword_match = self._POSITION_RE.search(text)
+        keyword = offset = None
+        if keyword_match:
+            keyword = keyword_match.group(1)
+            offset = self._POSITION_OFFSETS[keyword]
+            position = offset
 
         # Check for explicit coordinates
-        coord_pattern = r'\(?\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\)?'
-        match = re.search(coord_pattern, text)
+        match = _COORD_RE.search(text)
         if match:
-            position = {
-                "x": float(match.group(1)),
-                "y": float(match.group(2)),
-                "z": float(match.group(3))
-            }
+            position = _Vec3(float(match.group(1)), float(match.group(2)), float(match.group(3)))
 
         # Check for relative positioning to other objects
-        if context and "objects" in context:
-            for obj in context["objects"]:
-                obj_name = obj.get("name", "").lower()
-                obj_type = obj.get("type", "").lower().replace("_", " ")
-                # Check for name, type, or parts of type (e.g. "robot" in "robot arm")
-                is_match = False
-                if obj_name and obj_name in text:
+        for obj in objects:
+            obj_name = obj.name
+            obj_type = obj.type_name
+            # Check for name, type, or parts of type (e.g. "robot" in "robot arm")
+            is_match = False
+            if obj_name and obj_name in text:
+                is_match = True
+            elif obj_type:
+                if obj_type in text:
                     is_match = True
-                elif obj_type:
-                    if obj_type in text:
-                        is_match = True
-                    else:
-                        # Check each word of the type (e.g. "robot")
-                        for part in obj_type.split():
-                            if len(part) > 3 and part in text:
-                                is_match = True
-                                break
-
-                if is_match:
-                    base_pos = obj.get("position", {"x": 0, "y": 0, "z": 0})
-                    # Add offset based on position keywords
-                    matches = []
-                    for keyword, offset in self.POSITION_KEYWORDS:
-                        pattern = rf'\b{re.escape(keyword)}\b'
-                        match = re.search(pattern, text)
-                        if match:
-                            target_y = base_pos["y"] + offset["y"]
-                            # For keywords that imply being on the ground next to something,
-                            # ensure y is 0 (ground level)
-                            if keyword in ["near", "beside", "next to", "left", "right", "front", "back", "on the left", "on the right", "on the front", "on the back", "around"]:
-                                target_y = 0
-
-                            pos = {
-                                "x": base_pos["x"] + offset["x"],
-                                "y": target_y,
-                                "z": base_pos["z"] + offset["z"]
-                            }
-                            matches.append((match.start(), pos))
-
-                    if matches:
-                        matches.sort(key=lambda x: x[0])
-                        position = matches[0][1]
-                    else:
-                        # Default offset if no keyword (default to ground level next to object)
-                        position = {
-                            "x": base_pos["x"] + 3,
-                            "y": 0,
-                            "z": base_pos["z"]
-                        }
-                    break
+                else:
+                    # Check each word of the type (e.g. "robot")
+                    for part in obj_type.split():
+                        if len(part) > 3 and part in text:
+                            is_match = True
+                            break
+
+            if is_match:
+                base_pos = obj.data.get("position", {"x": 0, "y": 0, "z": 0})
+                base_x, base_y, base_z = base_pos["x"], base_pos["y"], base_pos["z"]
+                # Add offset based on the earliest position keyword
+                if keyword:
+                    target_y = base_y + offset.y
+                    # For keywords that imply being on the ground next to something,
+                    # ensure y is 0 (ground level)
+                    if keyword in self._GROUND_KEYWORDS:
+                        target_y = 0
+
+                    position = _Vec3(base_x + offset.x, target_y, base_z + offset.z)
+                else:
+                    # Default offset if no keyword (default to ground level next to object)
+                    position = _Vec3(base_x + 3, 0, base_z)
+                break
 
         return position
 
-    def _find_target_object(self, text: str, context: Optional[Dict] = None) -> Optional[str]:
+    def _find_target_object(self, text: str, objects: _Objects = ()) -> Optional[str]:
         """Find the target object ID from text."""
-        if not context or "objects" not in context:
+        if not objects:
             return None
 
-        # Find all matching objects and their positions in the text
-        text_lower = text.lower()
-        matches = []
-        for obj in context["objects"]:
-            obj_name = obj.get("name", "").lower()
-            obj_type = obj.get("type", "").lower().replace("_", " ")
-            obj_id = obj.get("id", "")
-
-            # Check for name match
-            if obj_name:
-                index = text_lower.find(obj_name)
-                if index != -1:
-                    matches.append((index, len(obj_name), obj_id))
-
-            # Check for type match
-            index = text_lower.find(obj_type)
-            if index != -1:
-                matches.append((index, len(obj_type), obj_id))
-
-        if matches:
-            # Sort by index (earliest first), then by length (longest first)
-            matches.sort(key=lambda x: (x[0], -x[1]))
+        # Track the earliest match in the text and every (length, object) found at that index
+        earliest = -1
+        tied = []
+        for obj in objects:
+            # Check for name match, then type match
+            for phrase in ((obj.name, obj.type_name) if obj.name else (obj.type_name,)):
+                index = text.find(phrase)
+                if index == -1:
+                    continue
+                if earliest == -1 or index < earliest:
+                    earliest = index
+                    tied = [(len(phrase), obj)]
+                elif index == earliest:
+                    tied.append((len(phrase), obj))
+
+        if tied:
+            # The longest match wins; the first one found breaks ties
+            best_len, best = tied[0]
+            for length, obj in tied:
+                if length > best_len:
+                    best_len, best = length, obj
 
             # If we have multiple matches at the same earliest position, try to disambiguate by color
-            earliest_idx = matches[0][0]
-            candidates_at_earliest = [m for m in matches if m[0] == earliest_idx]
-
-            if len(candidates_at_earliest) > 1:
+            if len(tied) > 1:
                 prompt_color = self._extract_color(text)
                 if prompt_color:
-                    for _, _, obj_id in candidates_at_earliest:
-                        # Find object in context to check its color
-                        for obj in context["objects"]:
-                            if obj.get("id") == obj_id:
-                                obj_color = obj.get("color", "").lower()
-                                if obj_color == prompt_color:
-                                    return obj_id
+                    color_len, color_match = -1, None
+                    for length, obj in tied:
+                        if length > color_len and obj.data.get("color", "").lower() == prompt_color:
+                            color_len, color_match = length, obj
+                    if color_match:
+                        return color_match.id
 
-            return matches[0][2]
+            return best.id
 
         # Try to match object type from OBJECT_MAPPINGS if no direct match in context
-        obj_type_enum, _ = self._extract_object_type(text_lower)
+        obj_type_enum, _ = self._extract_object_type(text)
         if obj_type_enum:
-            for obj in context["objects"]:
-                if obj.get("type") == obj_type_enum.value:
-                    return obj.get("id")
+            for obj in objects:
+                if obj.data.get("type") == obj_type_enum.value:
+                    return obj.data.get("id")
 
         return None
 
-    def _parse_add_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
-        """Parse add/create/place commands."""
-        add_patterns = [
-            r'\b(add|create|place|put|insert|spawn|generate)\b',
-        ]
-
-        for pattern in add_patterns:
-            if re.search(pattern, text):
-                obj_type, matched = self._extract_object_type(text)
-                if obj_type:
-                    position = self._extract_position(text, context)
-                    color = self._extract_color(text) or "#888888"
-                    obj_id = self._generate_object_id(obj_type.value, context)
+    def _find_reference_object(
+        self,
+        text: str,
+        objects: _Objects,
+        target: str
+    ) -> Optional[_ContextObject]:
+        """Find an object other than the target that the text names as a position reference."""
+        moved = next((obj for obj in objects if obj.id == target), None)
+        for obj in objects:
+            if obj is moved:
+                continue
+            if moved and obj.data.get("type") == moved.data.get("type"):
+                # A type word shared with the target can't tell the two apart; need a distinct name
+                phrases = (obj.name,) if obj.name not in (moved.name, moved.type_name) else ()
+            else:
+                # As in _extract_position, a longer word of the type also counts ("robot")
+                parts = tuple(part for part in obj.type_name.split() if len(part) > 3)
+                phrases = (obj.name, obj.type_name) + parts
+            if any(phrase and phrase in text for phrase in phrases):
+                return obj
+        return None
 
-                    return [SceneAction(
-                        action=ActionType.ADD_OBJECT,
-                        target=obj_id,
-                        params={
-                            "type": obj_type.value,
-                            "name": obj_type.value.replace("_", " ").title(),
-                            "position": position,
-                            "rotation": {"x": 0, "y": 0, "z": 0},
-                            "scale": {"x": 1, "y": 1, "z": 1},
-                            "color": color
-                        }
-                    )]
+    def _add_object_action(self, obj_type: ObjectType, text: str, objects: _Objects) -> SceneAction:
+        """Build the action adding a new object of a type, placed and colored per the text."""
+        position = self._extract_position(text, objects)
+        color = self._extract_color(text) or "#888888"
+        obj_id = self._generate_object_id(obj_type.value, objects)
+
+        return SceneAction(
+            action=ActionType.ADD_OBJECT,
+            target=obj_id,
+            params={
+                "type": obj_type.value,
+                "name": obj_type.value.replace("_", " ").title(),
+                "position": position._asdict(),
+                "rotation": {"x": 0, "y": 0, "z": 0},
+                "scale": {"x": 1, "y": 1, "z": 1},
+                "color": color
+            }
+        )
+
+    def _parse_add_command(self, text: str, objects: _Objects) -> List[SceneAction]:
+        """Parse add/create/place commands."""
+        if _ADD_RE.search(text):
+            obj_type, _ = self._extract_object_type(text)
+            if obj_type:
+                return [self._add_object_action(obj_type, text, objects)]
         return []
 
-    def _parse_remove_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_remove_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse remove/delete commands."""
-        remove_patterns = [
-            r'\b(remove|delete|destroy|clear|erase)\b',
-        ]
-
-        for pattern in remove_patterns:
-            if re.search(pattern, text):
-                target = self._find_target_object(text, context)
-                if target:
-                    return [SceneAction(
-                        action=ActionType.REMOVE_OBJECT,
-                        target=target,
-                        params={}
-                    )]
-                # Check for "all" or "everything"
-                if any(word in text for word in ['all', 'everything', 'scene']):
-                    return [SceneAction(
-                        action=ActionType.RESET_SCENE,
-                        target="scene",
-                        params={"keep_defaults": False}
-                    )]
+        if _REMOVE_RE.search(text):
+            target = self._find_target_object(text, objects)
+            if target:
+                return [SceneAction(
+                    action=ActionType.REMOVE_OBJECT,
+                    target=target,
+                    params={}
+                )]
+            # Check for "all" or "everything"
+            if _REMOVE_ALL_RE.search(text):
+                return [SceneAction(
+                    action=ActionType.RESET_SCENE,
+                    target="scene",
+                    params={"keep_defaults": False}
+                )]
         return []
 
-    def _parse_rotate_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_rotate_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse rotate/turn/spin commands."""
-        rotate_patterns = [
-            r'\b(rotate|turn|spin|twist|orient)\b',
-        ]
-
-        for pattern in rotate_patterns:
-            if re.search(pattern, text):
-                target = self._find_target_object(text, context)
-                if target:
-                    degrees = self._extract_degrees(text) or 30
-                    axis = self._extract_axis(text)
+        if _ROTATE_RE.search(text):
+            target = self._find_target_object(text, objects)
+            if target:
+                degrees = self._extract_degrees(text) or 30
+                axis = self._extract_axis(text)
 
-                    return [SceneAction(
-                        action=ActionType.ROTATE_OBJECT,
-                        target=target,
-                        params={
-                            "axis": axis,
-                            "degrees": degrees
-                        }
-                    )]
+                return [SceneAction(
+                    action=ActionType.ROTATE_OBJECT,
+                    target=target,
+                    params={
+                        "axis": axis,
+                        "degrees": degrees
+                    }
+                )]
         return []
 
-    def _parse_move_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_move_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse move/shift/translate commands."""
-        move_patterns = [
-            r'\b(move|shift|translate|position|relocate)\b',
-        ]
-
-        for pattern in move_patterns:
-            if re.search(pattern, text):
-                target = self._find_target_object(text, context)
-                if target:
-                    # Extract movement direction and amount
-                    delta = {"x": 0, "y": 0, "z": 0}
-                    amount = self._extract_number(text, 2)
-
-                    if 'left' in text:
-                        delta["x"] = -amount
-                    elif 'right' in text:
-                        delta["x"] = amount
-                    if 'up' in text:
-                        delta["y"] = amount
-                    elif 'down' in text:
-                        delta["y"] = -amount
-                    if 'forward' in text or 'front' in text:
-                        delta["z"] = amount
-                    elif 'back' in text or 'backward' in text:
-                        delta["z"] = -amount
-
-                    # Check for absolute position
-                    position = self._extract_position(text, context)
-                    if position != {"x": 0, "y": 0, "z": 0}:
-                        return [SceneAction(
-                            action=ActionType.MOVE_OBJECT,
-                            target=target,
-                            params={"position": position, "absolute": True}
-                        )]
-
+        if _MOVE_RE.search(text):
+            target = self._find_target_object(text, objects)
+            if target:
+                # Explicit coordinates, or a position keyword with another object named as
+                # the reference, give an absolute position; anything else is a relative move
+                position = None
+                if _COORD_RE.search(text):
+                    position = self._extract_position(text)
+                elif self._POSITION_RE.search(text):
+                    reference = self._find_reference_object(text, objects, target)
+                    if reference:
+                        position = self._extract_position(text, (reference,))
+                if position is not None:
                     return [SceneAction(
                         action=ActionType.MOVE_OBJECT,
                         target=target,
-                        params={"delta": delta, "absolute": False}
+                        params={"position": position._asdict(), "absolute": True}
                     )]
+
+                # Extract movement direction and amount
+                delta = {"x": 0, "y": 0, "z": 0}
+                amount = self._extract_number(text, 2)
+
+                found = set(_DIRECTION_RE.findall(text))
+                moved = {}
+                for word, axis, sign in _DIRECTIONS:
+                    if word in found:
+                        moved.setdefault(axis, sign * amount)
+                delta.update(moved)
+
+                return [SceneAction(
+                    action=ActionType.MOVE_OBJECT,
+                    target=target,
+                    params={"delta": delta, "absolute": False}
+                )]
         return []
 
-    def _parse_scale_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_scale_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse scale/resize/grow/shrink commands."""
-        scale_patterns = [
-            r'\b(scale|resize|grow|shrink|enlarge|expand|reduce)\b',
-        ]
-
-        for pattern in scale_patterns:
-            if re.search(pattern, text):
-                target = self._find_target_object(text, context)
-                if target:
-                    factor = self._extract_number(text, 1.5)
-                    if any(word in text for word in ['shrink', 'reduce', 'smaller']):
-                        factor = 1 / max(factor, 1)
-                    elif factor < 0.1 or factor > 10:
-                        factor = 1.5 if 'grow' in text or 'enlarge' in text else 0.5
+        if _SCALE_RE.search(text):
+            target = self._find_target_object(text, objects)
+            if target:
+                factor = self._extract_number(text, 1.5)
+                if _SHRINK_RE.search(text):
+                    factor = 1 / max(factor, 1)
+                elif factor < 0.1 or factor > 10:
+                    factor = 1.5 if _GROW_RE.search(text) else 0.5
 
-                    return [SceneAction(
-                        action=ActionType.SCALE_OBJECT,
-                        target=target,
-                        params={"factor": factor}
-                    )]
+                return [SceneAction(
+                    action=ActionType.SCALE_OBJECT,
+                    target=target,
+                    params={"factor": factor}
+                )]
         return []
 
-    def _parse_color_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_color_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse color/paint commands."""
-        color_patterns = [
-            r'\b(color|paint|make|set|change).*?(red|green|blue|yellow|orange|purple|pink|cyan|white|black|gray|grey|silver|gold|brown|#[0-9a-fA-F]{6})\b',
-        ]
-
         color = self._extract_color(text)
-        if color and any(word in text for word in ['color', 'paint', 'make', 'set', 'change']):
-            target = self._find_target_object(text, context)
+        if color and _COLOR_VERB_RE.search(text):
+            target = self._find_target_object(text, objects)
             if target:
                 return [SceneAction(
                     action=ActionType.SET_COLOR,
@@ -494,95 +633,85 @@ class PromptParser:
                 )]
         return []
 
-    def _parse_highlight_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_highlight_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse highlight/glow/mark commands."""
-        highlight_patterns = [
-            r'\b(highlight|glow|mark|emphasize|select)\b',
-        ]
-
-        for pattern in highlight_patterns:
-            if re.search(pattern, text):
-                target = self._find_target_object(text, context)
-                color = self._extract_color(text) or "#ffff00"
-
-                # Check for safety zone highlighting
-                if 'safety' in text or 'zone' in text or 'area' in text:
-                    obj_id = self._generate_object_id("safety_zone", context)
-                    position = self._extract_position(text, context)
+        if _HIGHLIGHT_RE.search(text):
+            target = self._find_target_object(text, objects)
+            color = self._extract_color(text) or "#ffff00"
+
+            # Check for safety zone highlighting
+            if 'safety' in text or 'zone' in text or 'area' in text:
+                obj_id = self._generate_object_id("safety_zone", objects)
+                position = self._extract_position(text, objects)
+                return [SceneAction(
+                    action=ActionType.ADD_SAFETY_ZONE,
+                    target=obj_id,
+                    params={
+                        "position": position._asdict(),
+                        "color": color,
+                        "size": {"x": 5, "y": 0.1, "z": 5}
+                    }
+                )]
+
+            if target:
+                return [SceneAction(
+                    action=ActionType.HIGHLIGHT_OBJECT,
+                    target=target,
+                    params={"color": color, "duration": 3000}
+                )]
+        return []
+
+    def _parse_camera_command(self, text: str, objects: _Objects) -> List[SceneAction]:
+        """Parse camera/zoom/view commands."""
+        if _CAMERA_RE.search(text):
+            # Check for predefined camera positions
+            for target_name, camera_config in self.CAMERA_TARGETS.items():
+                if target_name in text:
                     return [SceneAction(
-                        action=ActionType.ADD_SAFETY_ZONE,
-                        target=obj_id,
-                        params={
-                            "position": position,
-                            "color": color,
-                            "size": {"x": 5, "y": 0.1, "z": 5}
-                        }
+                        action=ActionType.CAMERA_FOCUS,
+                        target="camera",
+                        params=camera_config
                     )]
 
-                if target:
+            # Check for zoom in/out
+            if 'zoom' in text:
+                if 'in' in text:
                     return [SceneAction(
-                        action=ActionType.HIGHLIGHT_OBJECT,
-                        target=target,
-                        params={"color": color, "duration": 3000}
+                        action=ActionType.CAMERA_ZOOM,
+                        target="camera",
+                        params={"direction": "in", "amount": 0.5}
+                    )]
+                elif 'out' in text:
+                    return [SceneAction(
+                        action=ActionType.CAMERA_ZOOM,
+                        target="camera",
+                        params={"direction": "out", "amount": 0.5}
                     )]
-        return []
 
-    def _parse_camera_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
-        """Parse camera/zoom/view commands."""
-        camera_patterns = [
-            r'\b(zoom|camera|view|look|focus|pan)\b',
-        ]
-
-        for pattern in camera_patterns:
-            if re.search(pattern, text):
-                # Check for predefined camera positions
-                for target_name, camera_config in self.CAMERA_TARGETS.items():
-                    if target_name in text:
+            # Focus on a specific object
+            target = self._find_target_object(text, objects)
+            if target:
+                for obj in objects:
+                    if obj.id == target:
+                        pos = obj.data.get("position", {"x": 0, "y": 0, "z": 0})
                         return [SceneAction(
                             action=ActionType.CAMERA_FOCUS,
                             target="camera",
-                            params=camera_config
-                        )]
-
-                # Check for zoom in/out
-                if 'zoom' in text:
-                    if 'in' in text:
-                        return [SceneAction(
-                            action=ActionType.CAMERA_ZOOM,
-                            target="camera",
-                            params={"direction": "in", "amount": 0.5}
-                        )]
-                    elif 'out' in text:
-                        return [SceneAction(
-                            action=ActionType.CAMERA_ZOOM,
-                            target="camera",
-                            params={"direction": "out", "amount": 0.5}
+                            params={
+                                "position": {
+                                    "x": pos["x"] + 8,
+                                    "y": pos["y"] + 6,
+                                    "z": pos["z"] + 8
+                                },
+                                "target": pos
+                            }
                         )]
-
-                # Focus on a specific object
-                target = self._find_target_object(text, context)
-                if target and context:
-                    for obj in context.get("objects", []):
-                        if obj.get("id") == target:
-                            pos = obj.get("position", {"x": 0, "y": 0, "z": 0})
-                            return [SceneAction(
-                                action=ActionType.CAMERA_FOCUS,
-                                target="camera",
-                                params={
-                                    "position": {
-                                        "x": pos["x"] + 8,
-                                        "y": pos["y"] + 6,
-                                        "z": pos["z"] + 8
-                                    },
-                                    "target": pos
-                                }
-                            )]
         return []
 
-    def _parse_visibility_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_visibility_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse show/hide commands."""
-        if re.search(r'\b(hide|invisible)\b', text):
-            target = self._find_target_object(text, context)
+        if _HIDE_RE.search(text):
+            target = self._find_target_object(text, objects)
             if target:
                 return [SceneAction(
                     action=ActionType.SET_VISIBILITY,
@@ -590,8 +719,8 @@ class PromptParser:
                     params={"visible": False}
                 )]
 
-        if re.search(r'\b(show|visible|reveal)\b', text):
-            target = self._find_target_object(text, context)
+        if _SHOW_RE.search(text):
+            target = self._find_target_object(text, objects)
             if target:
                 return [SceneAction(
                     action=ActionType.SET_VISIBILITY,
@@ -601,9 +730,9 @@ class PromptParser:
 
         return []
 
-    def _parse_reset_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_reset_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse reset/clear commands."""
-        if re.search(r'\b(reset|clear|restart)\b(?:\s+the)?\s*\b(scene|all|everything)\b', text):
+        if _RESET_RE.search(text):
             return [SceneAction(
                 action=ActionType.RESET_SCENE,
                 target="scene",
@@ -611,10 +740,10 @@ class PromptParser:
             )]
         return []
 
-    def _parse_animate_command(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _parse_animate_command(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Parse animate/start/stop commands."""
-        if re.search(r'\b(animate|start|run|activate)\b', text):
-            target = self._find_target_object(text, context)
+        if _ANIMATE_START_RE.search(text):
+            target = self._find_target_object(text, objects)
             if target:
                 return [SceneAction(
                     action=ActionType.ANIMATE_OBJECT,
@@ -622,8 +751,8 @@ class PromptParser:
                     params={"animate": True}
                 )]
 
-        if re.search(r'\b(stop|pause|deactivate)\b', text):
-            target = self._find_target_object(text, context)
+        if _ANIMATE_STOP_RE.search(text):
+            target = self._find_target_object(text, objects)
             if target:
                 return [SceneAction(
                     action=ActionType.ANIMATE_OBJECT,
@@ -633,27 +762,27 @@ class PromptParser:
 
         return []
 
-    def _infer_intent(self, text: str, context: Optional[Dict]) -> List[SceneAction]:
+    def _infer_intent(self, text: str, objects: _Objects) -> List[SceneAction]:
         """Try to infer user intent when no explicit command is found."""
         # Check if user is describing a scene element
         obj_type, _ = self._extract_object_type(text)
         if obj_type:
             # Assume they want to add it
-            position = self._extract_position(text, context)
-            color = self._extract_color(text) or "#888888"
-            obj_id = self._generate_object_id(obj_type.value, context)
+            return [self._add_object_action(obj_type, text, objects)]
 
-            return [SceneAction(
-                action=ActionType.ADD_OBJECT,
-                target=obj_id,
-                params={
-                    "type": obj_type.value,
-                    "name": obj_type.value.replace("_", " ").title(),
-                    "position": position,
-                    "rotation": {"x": 0, "y": 0, "z": 0},
-                    "scale": {"x": 1, "y": 1, "z": 1},
-                    "color": color
-                }
-            )]
+        return []
 
-        return []
\ No newline at end of file
+    # Command parsers, in the order parse() tries them
+    _PARSERS = (
+        _parse_add_command,
+        _parse_remove_command,
+        _parse_rotate_command,
+        _parse_move_command,
+        _parse_scale_command,
+        _parse_color_command,
+        _parse_highlight_command,
+        _parse_camera_command,
+        _parse_visibility_command,
+        _parse_reset_command,
+        _parse_animate_command,
+    )
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+import orjson
+from cachetools import LRUCache
+from ..models.scene import Scene
+from ..schemas.scene import SceneResponse
+
+
+class SceneCache:
+    """
+    In-process read-through cache of encoded scene responses.
+    Entries are keyed by scene ID and tagged with the scene's last-modified
+    timestamp, so a stale entry is never served even across workers.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries = LRUCache(maxsize=maxsize)
+
+    def get(self, scene_id: int, version: datetime) -> Optional[bytes]:
+        """Get the encoded response for a scene if it is cached at this version."""
+        entry = self._entries.get(scene_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        return None
+
+    def put(self, scene: Scene) -> bytes:
+        """Encode a scene response and cache it under the scene's current version."""
+        body = orjson.dumps(SceneResponse.model_validate(scene).model_dump())
+        self._entries[scene.id] = (scene.updated_at or scene.created_at, body)
+        return body
+
+    def invalidate(self, scene_id: int) -> None:
+        """Drop any cached response for a scene."""
+        self._entries.pop(scene_id, None)
+
+
+scene_cache = SceneCache()
@@ -1,66 +1,107 @@
+from datetime import datetime
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from ..models.scene import Scene
 from ..schemas.scene import SceneCreate, SceneUpdate
+from .scene_cache import scene_cache
 
 
 class SceneService:
     """Service for managing scene persistence."""
 
     @staticmethod
-    def create_scene(db: Session, scene_data: SceneCreate, user_id: int) -> Scene:
+    async def create_scene(db: AsyncSession, scene_data: SceneCreate, user_id: int) -> Scene:
         """Create a new scene."""
         db_scene = Scene(
             name=scene_data.name,
             description=scene_data.description,
-            scene_data=scene_data.scene_data.model_dump(),
+            scene_data=scene_data.scene_data.model_dump(mode="json"),
             owner_id=user_id
         )
         db.add(db_scene)
-        db.commit()
-        db.refresh(db_scene)
+        await db.commit()
+        await db.refresh(db_scene)
         return db_scene
 
     @staticmethod
-    def get_scene(db: Session, scene_id: int, user_id: int) -> Optional[Scene]:
+    async def get_scene(db: AsyncSession, scene_id: int, user_id: int) -> Optional[Scene]:
         """Get a scene by ID."""
-        return db.query(Scene).filter(
+        # Primary key lookup, served from the session's identity map when already loaded
+        scene = await db.get(Scene, scene_id)
+        if not scene or scene.owner_id != user_id:
+            return None
+        return scene
+
+    @staticmethod
+    async def get_scene_version(
+        db: AsyncSession,
+        scene_id: int,
+        user_id: int
+    ) -> Optional[datetime]:
+        """Get the last-modified timestamp of a scene without loading its data."""
+        result = await db.execute(select(Scene.created_at, Scene.updated_at).where(
             Scene.id == scene_id,
             Scene.owner_id == user_id
-        ).first()
+        ))
+        row = result.first()
+        if not row:
+            return None
+        return row.updated_at or row.created_at
 
     @staticmethod
-    def get_scenes(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Scene]:
-        """Get all scenes for a user."""
-        return db.query(Scene).filter(
-            Scene.owner_id == user_id
-        ).offset(skip).limit(limit).all()
+    async def get_scenes(
+        db: AsyncSession,
+        user_id: int,
+        cursor: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Scene]:
+        """Get a page of scenes for a user, newest first, starting below the cursor ID."""
+        # Listings only show metadata, so leave the scene JSON unloaded
+        query = select(Scene).options(defer(Scene.scene_data)).where(Scene.owner_id == user_id)
+        if cursor is not None:
+            query = query.where(Scene.id < cursor)
+        result = await db.execute(query.order_by(Scene.id.desc()).limit(limit))
+        return result.scalars().all()
 
     @staticmethod
-    def update_scene(db: Session, scene_id: int, user_id: int, scene_data: SceneUpdate) -> Optional[Scene]:
+    async def update_scene(
+        db: AsyncSession,
+        scene_id: int,
+        user_id: int,
+        scene_data: SceneUpdate
+    ) -> Optional[Scene]:
         """Update a scene."""
-        db_scene = SceneService.get_scene(db, scene_id, user_id)
+        update_data = scene_data.model_dump(mode="json", exclude_unset=True)
+        if not update_data:
+            return await SceneService.get_scene(db, scene_id, user_id)
+
+        # One UPDATE ... RETURNING instead of load, modify, flush and refresh
+        result = await db.execute(
+            update(Scene)
+            .where(Scene.id == scene_id, Scene.owner_id == user_id)
+            .values(**update_data)
+            .returning(Scene)
+            .execution_options(populate_existing=True)
+        )
+        db_scene = result.scalars().first()
         if not db_scene:
             return None
 
-        update_data = scene_data.model_dump(exclude_unset=True)
-        if "scene_data" in update_data and update_data["scene_data"]:
-            update_data["scene_data"] = update_data["scene_data"]
-
-        for field, value in update_data.items():
-            setattr(db_scene, field, value)
-
-        db.commit()
-        db.refresh(db_scene)
+        await db.commit()
+        scene_cache.invalidate(scene_id)
         return db_scene
 
     @staticmethod
-    def delete_scene(db: Session, scene_id: int, user_id: int) -> bool:
+    async def delete_scene(db: AsyncSession, scene_id: int, user_id: int) -> bool:
         """Delete a scene."""
-        db_scene = SceneService.get_scene(db, scene_id, user_id)
-        if not db_scene:
+        result = await db.execute(
+            delete(Scene).where(Scene.id == scene_id, Scene.owner_id == user_id)
+        )
+        if not result.rowcount:
             return False
 
-        db.delete(db_scene)
-        db.commit()
+        await db.commit()
+        scene_cache.invalidate(scene_id)
         return True
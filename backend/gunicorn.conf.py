@@ -0,0 +1,47 @@
+# Gunicorn configuration for production deployments.
+# Run with: gunicorn -c gunicorn.conf.py app.main:app
+import os
+
+if hasattr(os, "sched_getaffinity"):
+    _CPUS = sorted(os.sched_getaffinity(0))
+else:
+    _CPUS = []
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", len(_CPUS) or os.cpu_count() or 1))
+
+# Uvicorn's worker picks uvloop and httptools when installed (uvicorn[standard])
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 5
+
+# Import the app once in the master, so the tables are created before any worker
+# starts instead of every worker racing on CREATE TABLE against a fresh database
+preload_app = True
+
+
+def pre_fork(server, worker):
+    """Pick a CPU for the new worker that no live worker is pinned to.
+
+    Runs in the master, so the choice is recorded on the master's copy of the
+    worker and is seen when a replacement worker is forked later.
+    """
+    if not _CPUS:
+        return
+    used = [w.cpu for w in server.WORKERS.values() if getattr(w, "cpu", None) is not None]
+    free = [cpu for cpu in _CPUS if cpu not in used]
+    # With more workers than CPUs, share the least used one
+    worker.cpu = free[0] if free else min(_CPUS, key=used.count)
+
+
+def post_fork(server, worker):
+    """Drop connections inherited from the master and pin the worker to its CPU."""
+    from app.core.database import async_engine, engine
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+    cpu = getattr(worker, "cpu", None)
+    if cpu is None:
+        return
+    os.sched_setaffinity(0, {cpu})
+    server.log.info("Worker %s pinned to CPU %s", worker.pid, cpu)
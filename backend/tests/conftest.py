@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the backend tests.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+
+SCENE_CREATED_AT = datetime(2024, 1, 2, 3, 4, 5)
+
+
+@pytest.fixture
+def make_scene():
+    """Build plain attribute objects standing in for the Scene model, so no database is needed."""
+    def _make(scene_data=None, updated_at=None):
+        if scene_data is None:
+            scene_data = {"objects": [{"id": "box_1", "type": "box"}]}
+        return SimpleNamespace(
+            id=7,
+            name="Line 1",
+            description=None,
+            scene_data=scene_data,
+            owner_id=3,
+            created_at=SCENE_CREATED_AT,
+            updated_at=updated_at
+        )
+    return _make
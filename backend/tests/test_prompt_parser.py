@@ -2,59 +2,135 @@
 Tests for the PromptParser service.
 Run with: pytest tests/test_prompt_parser.py -v
 """
+import copy
+from types import MappingProxyType
 import pytest
 from app.services.prompt_parser import PromptParser
 from app.schemas.action import ActionType, ObjectType
 
-
-@pytest.fixture
+# Enum members and values used in assertions; action types are compared by identity
+ADD_OBJECT = ActionType.ADD_OBJECT
+CAMERA_ZOOM = ActionType.CAMERA_ZOOM
+CAMERA_FOCUS = ActionType.CAMERA_FOCUS
+ADD_SAFETY_ZONE = ActionType.ADD_SAFETY_ZONE
+RESET_SCENE = ActionType.RESET_SCENE
+ROTATE_OBJECT = ActionType.ROTATE_OBJECT
+SET_COLOR = ActionType.SET_COLOR
+HIGHLIGHT_OBJECT = ActionType.HIGHLIGHT_OBJECT
+SET_VISIBILITY = ActionType.SET_VISIBILITY
+SCALE_OBJECT = ActionType.SCALE_OBJECT
+ANIMATE_OBJECT = ActionType.ANIMATE_OBJECT
+MOVE_OBJECT = ActionType.MOVE_OBJECT
+ROBOT_ARM_VALUE = ObjectType.ROBOT_ARM.value
+CONVEYOR_VALUE = ObjectType.CONVEYOR.value
+
+# Shared by every test through the scene_context fixture; read-only so no test can leak changes
+SCENE_CONTEXT = MappingProxyType({
+    "objects": (
+        {
+            "id": "conveyor_1",
+            "type": "conveyor",
+            "name": "Main Conveyor",
+            "position": {"x": 0, "y": 0.5, "z": 0}
+        },
+        {
+            "id": "robot_arm_1",
+            "type": "robot_arm",
+            "name": "Robot Arm",
+            "position": {"x": -5, "y": 0, "z": 0}
+        }
+    )
+})
+
+
+@pytest.fixture(scope="session")
 def parser():
     return PromptParser()
 
 
-@pytest.fixture
-def scene_context():
-    return {
-        "objects": [
-            {
-                "id": "conveyor_1",
-                "type": "conveyor",
-                "name": "Main Conveyor",
-                "position": {"x": 0, "y": 0.5, "z": 0}
-            },
-            {
-                "id": "robot_arm_1",
-                "type": "robot_arm",
-                "name": "Robot Arm",
-                "position": {"x": -5, "y": 0, "z": 0}
-            }
-        ]
-    }
-
-
-class TestAddCommands:
-    def test_add_robot_arm(self, parser):
-        actions = parser.parse("Add a robotic arm")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.ADD_OBJECT
-        assert actions[0].params["type"] == ObjectType.ROBOT_ARM.value
-
-    def test_add_conveyor(self, parser):
-        actions = parser.parse("Create a conveyor belt")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.ADD_OBJECT
-        assert actions[0].params["type"] == ObjectType.CONVEYOR.value
-
-    def test_add_with_color(self, parser):
-        actions = parser.parse("Add a blue box")
-        assert len(actions) == 1
-        assert actions[0].params["color"] == "#4444ff"
+@pytest.fixture(autouse=True)
+def fresh_ids(parser):
+    # The parser is shared across tests; only its ID numbering needs resetting
+    parser.reset_ids()
 
-    def test_add_with_position(self, parser):
-        actions = parser.parse("Add a box on the left")
-        assert len(actions) == 1
-        assert actions[0].params["position"]["x"] < 0
 
+@pytest.fixture(scope="session")
+def scene_context():
+    return SCENE_CONTEXT
+
+
+def _dig(params, dotted_key):
+    """Look up a possibly nested param, e.g. "position.x"."""
+    value = params
+    for part in dotted_key.split("."):
+        value = value[part]
+    return value
+
+
+def _negative(value):
+    return value < 0
+
+
+def _positive(value):
+    return value > 0
+
+
+def _above_one(value):
+    return value > 1
+
+
+def _check(parser, prompt, context, *, action, **expected):
+    """Parse a prompt expecting one action of the given type with the given params.
+
+    Expected values may be predicates; booleans are compared by identity.
+    """
+    actions = parser.parse(prompt, context)
+    assert len(actions) == 1
+    assert actions[0].action is action
+    for key, want in expected.items():
+        value = _dig(actions[0].params, key)
+        if callable(want):
+            assert want(value), f"{key}={value!r}"
+        elif isinstance(want, bool):
+            assert value is want
+        else:
+            assert value == want
+
+
+class TestCommands:
+    @pytest.mark.parametrize("prompt, in_scene, action, expected", [
+        ("Add a robotic arm", False, ADD_OBJECT, {"type": ROBOT_ARM_VALUE}),
+        ("Create a conveyor belt", False, ADD_OBJECT, {"type": CONVEYOR_VALUE}),
+        ("Add a blue box", False, ADD_OBJECT, {"color": "#4444ff"}),
+        ("Add a box on the left", False, ADD_OBJECT, {"position.x": _negative}),
+        ("Zoom in", False, CAMERA_ZOOM, {"direction": "in"}),
+        ("Zoom out", False, CAMERA_ZOOM, {"direction": "out"}),
+        ("Zoom camera to inspection area", False, CAMERA_FOCUS, {"target": {"x": 0, "y": 1, "z": 0}}),
+        ("Highlight safety zone in red", False, ADD_SAFETY_ZONE, {"color": "#ff4444"}),
+        ("Reset the scene", False, RESET_SCENE, {"keep_defaults": True}),
+        ("Rotate the robot arm 45 degrees", True, ROTATE_OBJECT, {"degrees": 45}),
+        ("Rotate the conveyor 30 degrees", True, ROTATE_OBJECT, {"axis": "y"}),  # Default axis
+        ("Rotate the robot arm 90 degrees on x axis", True, ROTATE_OBJECT, {"axis": "x"}),
+        ("Move the robot arm up", True, MOVE_OBJECT, {"absolute": False, "delta.y": _positive}),
+        ("Paint the conveyor red", True, SET_COLOR, {"color": "#ff4444"}),
+        ("Repaint the conveyor red", True, SET_COLOR, {"color": "#ff4444"}),
+        ("Recolor the robot arm blue", True, SET_COLOR, {"color": "#4444ff"}),
+        ("Reset the scene in red", False, RESET_SCENE, {}),  # "reset" is not "set"
+        ("Move the arm to the setup", True, MOVE_OBJECT, {"delta.y": 0}),  # "setup" is not "up"
+        ("Change the robot arm color to #00ff00", True, SET_COLOR, {"color": "#00ff00"}),
+        ("Highlight the conveyor", True, HIGHLIGHT_OBJECT, {"color": "#ffff00"}),
+        ("Hide the robot arm", True, SET_VISIBILITY, {"visible": False}),
+        ("Show the conveyor", True, SET_VISIBILITY, {"visible": True}),
+        ("Scale the conveyor to 1.5", True, SCALE_OBJECT, {"factor": 1.5}),
+        ("Grow the robot arm", True, SCALE_OBJECT, {"factor": _above_one}),
+        ("Start animating the robot arm", True, ANIMATE_OBJECT, {"animate": True}),
+        ("Stop the conveyor", True, ANIMATE_OBJECT, {"animate": False}),
+    ])
+    def test_parse_command(self, parser, scene_context, prompt, in_scene, action, expected):
+        _check(parser, prompt, scene_context if in_scene else None, action=action, **expected)
+
+
+class TestPlacement:
     def test_add_next_to_object(self, parser, scene_context):
         actions = parser.parse("Add a box next to the conveyor", scene_context)
         assert len(actions) == 1
@@ -62,126 +138,48 @@ class TestAddCommands:
         pos = actions[0].params["position"]
         assert pos["x"] != 0 or pos["z"] != 0
 
-
-class TestRotateCommands:
-    def test_rotate_with_degrees(self, parser, scene_context):
-        actions = parser.parse("Rotate the robot arm 45 degrees", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.ROTATE_OBJECT
-        assert actions[0].params["degrees"] == 45
-
-    def test_rotate_default_axis(self, parser, scene_context):
-        actions = parser.parse("Rotate the conveyor 30 degrees", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["axis"] == "y"  # Default axis
-
-    def test_rotate_specific_axis(self, parser, scene_context):
-        actions = parser.parse("Rotate the robot arm 90 degrees on x axis", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["axis"] == "x"
-
-
-class TestMoveCommands:
     def test_move_left(self, parser, scene_context):
         actions = parser.parse("Move the conveyor left", scene_context)
         assert len(actions) == 1
-        assert actions[0].action == ActionType.MOVE_OBJECT
+        assert actions[0].action is MOVE_OBJECT
         assert actions[0].params.get("delta", {}).get("x", 0) < 0 or \
                actions[0].params.get("position", {}).get("x", 0) < 0
 
-    def test_move_up(self, parser, scene_context):
-        actions = parser.parse("Move the robot arm up", scene_context)
-        assert len(actions) == 1
 
-
-class TestColorCommands:
-    def test_set_color_red(self, parser, scene_context):
-        actions = parser.parse("Paint the conveyor red", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.SET_COLOR
-        assert actions[0].params["color"] == "#ff4444"
-
-    def test_set_color_hex(self, parser, scene_context):
-        actions = parser.parse("Change the robot arm color to #00ff00", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["color"] == "#00ff00"
-
-
-class TestCameraCommands:
-    def test_zoom_in(self, parser):
-        actions = parser.parse("Zoom in")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.CAMERA_ZOOM
-        assert actions[0].params["direction"] == "in"
-
-    def test_zoom_out(self, parser):
-        actions = parser.parse("Zoom out")
-        assert len(actions) == 1
-        assert actions[0].params["direction"] == "out"
-
-    def test_camera_focus(self, parser):
-        actions = parser.parse("Zoom camera to inspection area")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.CAMERA_FOCUS
-
-
-class TestHighlightCommands:
-    def test_highlight_safety_zone(self, parser):
-        actions = parser.parse("Highlight safety zone in red")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.ADD_SAFETY_ZONE
-        assert actions[0].params["color"] == "#ff4444"
-
-    def test_highlight_object(self, parser, scene_context):
-        actions = parser.parse("Highlight the conveyor", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.HIGHLIGHT_OBJECT
-
-
-class TestVisibilityCommands:
-    def test_hide_object(self, parser, scene_context):
-        actions = parser.parse("Hide the robot arm", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.SET_VISIBILITY
-        assert actions[0].params["visible"] is False
-
-    def test_show_object(self, parser, scene_context):
-        actions = parser.parse("Show the conveyor", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["visible"] is True
-
-
-class TestScaleCommands:
-    def test_scale_up(self, parser, scene_context):
-        actions = parser.parse("Scale the conveyor to 1.5", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.SCALE_OBJECT
-        assert actions[0].params["factor"] == 1.5
-
-    def test_grow_object(self, parser, scene_context):
-        actions = parser.parse("Grow the robot arm", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["factor"] > 1
-
-
-class TestResetCommands:
-    def test_reset_scene(self, parser):
-        actions = parser.parse("Reset the scene")
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.RESET_SCENE
-
-
-class TestAnimationCommands:
-    def test_start_animation(self, parser, scene_context):
-        actions = parser.parse("Start animating the robot arm", scene_context)
-        assert len(actions) == 1
-        assert actions[0].action == ActionType.ANIMATE_OBJECT
-        assert actions[0].params["animate"] is True
-
-    def test_stop_animation(self, parser, scene_context):
-        actions = parser.parse("Stop the conveyor", scene_context)
-        assert len(actions) == 1
-        assert actions[0].params["animate"] is False
+    @pytest.mark.parametrize("prompt, axis, sign", [
+        ("Move the robot arm left", "x", -1),
+        ("Move the robot arm right", "x", 1),
+        ("Move the robot arm back", "z", -1),
+        ("Move the robot arm down", "y", -1),
+    ])
+    def test_move_direction_away_from_origin(self, parser, scene_context, prompt, axis, sign):
+        # The arm sits at x=-5, so a world-absolute "left" or "right" would be caught here
+        actions = parser.parse(prompt, scene_context)
+        assert len(actions) == 1
+        assert actions[0].target == "robot_arm_1"
+        assert actions[0].params["absolute"] is False
+        delta = actions[0].params["delta"]
+        assert delta[axis] * sign > 0
+        assert all(value == 0 for key, value in delta.items() if key != axis)
+
+    def test_move_next_to_named_object(self, parser, scene_context):
+        actions = parser.parse("Move the conveyor next to the robot arm", scene_context)
+        assert actions[0].target == "conveyor_1"
+        assert actions[0].params == {"position": {"x": -2, "y": 0, "z": 0}, "absolute": True}
+
+    def test_move_among_objects_of_same_type(self, parser):
+        context = {"objects": [
+            {"id": "box_1", "type": "box", "name": "Box", "color": "#4444ff",
+             "position": {"x": 4, "y": 0, "z": 1}},
+            {"id": "box_2", "type": "box", "name": "Box", "color": "#ff4444",
+             "position": {"x": -3, "y": 0, "z": 2}},
+        ]}
+        # The other box shares the type word, so it must not become a reference
+        for prompt in ("Move the red box up", "Move the red box to the left"):
+            actions = parser.parse(prompt, context)
+            assert len(actions) == 1
+            assert actions[0].target == "box_2"
+            assert actions[0].params["absolute"] is False, prompt
 
 
 class TestEdgeCases:
@@ -201,3 +199,49 @@ class TestEdgeCases:
         actions2 = parser.parse("Add a box")
         # IDs should be different
         assert actions1[0].target != actions2[0].target
+
+    def test_repeated_prompt_returns_independent_copies(self, parser, scene_context):
+        actions1 = parser.parse("Rotate the conveyor 45 degrees", scene_context)
+        actions1[0].params["degrees"] = 0
+        actions2 = parser.parse("Rotate the conveyor 45 degrees", scene_context)
+        assert actions2[0].params["degrees"] == 45
+
+    def test_repeated_prompt_sees_context_changes(self, parser, scene_context):
+        context = {"objects": copy.deepcopy(list(scene_context["objects"]))}
+        parser.parse("Focus on the arm", context)
+        context["objects"][1]["position"] = {"x": 10, "y": 0, "z": 0}
+        actions = parser.parse("Focus on the arm", context)
+        assert actions[0].params["target"]["x"] == 10
+
+    def test_new_id_skips_past_existing_ids(self, parser):
+        context = {"objects": [{"id": "box_3", "type": "box", "name": "Box"}]}
+        actions = parser.parse("Add a box", context)
+        assert actions[0].target == "box_4"
+
+    def test_parse_many_matches_parse(self, parser, scene_context):
+        prompts = ["Rotate the robot arm 45 degrees", "Zoom in", "Hide the conveyor", "Do something completely random xyz"]
+        batched = parser.parse_many(prompts, scene_context)
+        assert batched == [parser.parse(prompt, scene_context) for prompt in prompts]
+
+    def test_remove_all_needs_whole_word(self, parser, scene_context):
+        # "ball" and "smaller" contain "all" but must not clear the scene
+        for prompt in ("Remove the ball", "Remove something smaller"):
+            actions = parser.parse(prompt, scene_context)
+            assert all(a.action is not RESET_SCENE for a in actions), prompt
+
+    def test_mixed_intent_prompt_uses_first_matching_parser(self, parser, scene_context):
+        # Parsers are tried in a fixed order and the first that produces actions wins
+        actions = parser.parse("Add a box and rotate the arm", scene_context)
+        assert len(actions) == 1
+        assert actions[0].action is ADD_OBJECT
+        assert actions[0].params["type"] == "box"
+
+    def test_large_scene_is_not_memoized(self, parser):
+        context = {"objects": [
+            {"id": f"box_{i}", "type": "box", "name": f"Box {i}"} for i in range(1, 101)
+        ]}
+        cached = len(parser._results)
+        actions = parser.parse("Rotate box 50 by 45 degrees", context)
+        assert actions[0].action is ROTATE_OBJECT
+        # Keys for scenes this size would hold every object, so nothing is stored
+        assert len(parser._results) == cached
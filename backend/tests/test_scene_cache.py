@@ -0,0 +1,47 @@
+"""
+Tests for the SceneCache service.
+Run with: pytest tests/test_scene_cache.py -v
+"""
+from datetime import datetime
+import orjson
+import pytest
+from app.services.scene_cache import SceneCache
+
+UPDATED_AT = datetime(2024, 2, 3, 4, 5, 6)
+
+
+@pytest.fixture
+def cache():
+    return SceneCache(maxsize=4)
+
+
+class TestSceneCache:
+    def test_get_hits_at_same_version(self, cache, make_scene):
+        body = cache.put(make_scene(updated_at=UPDATED_AT))
+        assert orjson.loads(body)["id"] == 7
+        assert cache.get(7, UPDATED_AT) == body
+
+    def test_get_misses_at_other_version(self, cache, make_scene):
+        scene = make_scene(updated_at=UPDATED_AT)
+        cache.put(scene)
+        assert cache.get(7, scene.created_at) is None
+        assert cache.get(8, UPDATED_AT) is None
+
+    def test_put_keys_on_created_at_when_never_updated(self, cache, make_scene):
+        scene = make_scene()
+        body = cache.put(scene)
+        assert cache.get(7, scene.created_at) == body
+
+    def test_put_replaces_older_version(self, cache, make_scene):
+        scene = make_scene()
+        cache.put(scene)
+        body = cache.put(make_scene(updated_at=UPDATED_AT))
+        assert cache.get(7, scene.created_at) is None
+        assert cache.get(7, UPDATED_AT) == body
+
+    def test_invalidate_drops_entry(self, cache, make_scene):
+        cache.put(make_scene(updated_at=UPDATED_AT))
+        cache.invalidate(7)
+        assert cache.get(7, UPDATED_AT) is None
+        # Invalidating an uncached scene is a no-op
+        cache.invalidate(7)
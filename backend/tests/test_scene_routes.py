@@ -0,0 +1,34 @@
+"""
+Tests for the streamed scene encoding in the scene routes.
+Run with: pytest tests/test_scene_routes.py -v
+"""
+from datetime import datetime
+import orjson
+import pytest
+from app.api.routes.scene import scene_to_chunks
+from app.schemas.scene import SceneResponse
+
+
+class TestSceneToChunks:
+    @pytest.mark.parametrize("scene_data", [
+        {
+            "objects": [
+                {"id": "conveyor_1", "type": "conveyor", "position": {"x": 0, "y": 0.5, "z": 0}},
+                {"id": "box_1", "type": "box", "color": "#4444ff"}
+            ],
+            "camera": {"position": [5, 5, 5]},
+            "lighting": "studio"
+        },
+        {},
+        {"objects": []},
+        {"objects": [], "camera": {"zoom": 1.5}},
+    ])
+    def test_matches_scene_response(self, make_scene, scene_data):
+        scene = make_scene(scene_data, updated_at=datetime(2024, 2, 3, 4, 5, 6, 789000))
+        expected = orjson.dumps(SceneResponse.model_validate(scene).model_dump())
+        assert b"".join(scene_to_chunks(scene)) == expected
+
+    def test_without_updated_at(self, make_scene):
+        scene = make_scene()
+        expected = orjson.dumps(SceneResponse.model_validate(scene).model_dump())
+        assert b"".join(scene_to_chunks(scene)) == expected